@@ -3,7 +3,17 @@
 from flask import Flask
 
 from .config import Config
-from .extensions import babel, cache, cors, db, jwt, limiter, login_manager, migrate
+from .extensions import (
+    babel,
+    blocklist,
+    cache,
+    cors,
+    db,
+    jwt,
+    limiter,
+    login_manager,
+    migrate,
+)
 
 
 def create_app(config_class=Config):
@@ -19,6 +29,9 @@ def create_app(config_class=Config):
     # Initialize extensions
     _init_extensions(app)
 
+    # Prepare the password check for unknown usernames
+    _prepare_dummy_password_hash(app)
+
     # Register blueprints
     _register_blueprints(app)
 
@@ -51,6 +64,14 @@ def _init_extensions(app: Flask):
     cors.init_app(app)
     limiter.init_app(app)
     cache.init_app(app)
+    blocklist.init_app(app, config=app.config["JWT_BLOCKLIST_CACHE"])
+
+
+def _prepare_dummy_password_hash(app: Flask):
+    """Hash the dummy password for the configured method ahead of any login."""
+    from .models.user import dummy_password_hash
+
+    dummy_password_hash(app.config["PASSWORD_HASH_METHOD"])
 
 
 def _register_blueprints(app: Flask):
@@ -98,11 +119,11 @@ def _auto_init_database(app: Flask):
     """Auto-initialize database if needed."""
     import logging
 
-    from .db_init import init_database
+    from .db_init import init_database_once
 
     logger = logging.getLogger(__name__)
     try:
-        init_database(app)
+        init_database_once(app)
     except Exception as e:
         logger.warning(f"Database auto-initialization skipped or failed: {e}")
         # Don't fail startup - might be running migrations or CLI commands
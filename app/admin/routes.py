@@ -3,7 +3,7 @@
 from flask import Blueprint, flash, redirect, render_template, request, url_for
 from flask_login import current_user, login_user, logout_user
 
-from ..extensions import limiter
+from ..extensions import db, limiter
 from ..models import User
 from .views import AdminLoginForm
 
@@ -22,11 +22,11 @@ def login():
     form = AdminLoginForm()
 
     if form.validate_on_submit():
-        user = User.get_by_username(form.username.data)
+        auth = User.authenticate(form.username.data, form.password.data)
 
-        if user and user.check_password(form.password.data):
-            if user.is_admin or user.is_manager:
-                login_user(user)
+        if auth:
+            if auth.is_admin or auth.is_manager:
+                login_user(db.session.get(User, auth.id))
                 flash("Login successful!", "success")
                 next_page = request.args.get("next")
                 return redirect(next_page or url_for("admin.index"))
@@ -1,27 +1,113 @@
 """Authentication blueprint - handles user registration, login, and logout."""
 
-from flask import Blueprint, jsonify, request
+import functools
+import time
+
+from flask import Blueprint, current_app, g, jsonify, request
 from flask_jwt_extended import (
     create_access_token,
+    create_refresh_token,
+    get_jti,
     get_jwt,
     get_jwt_identity,
     jwt_required,
 )
+from werkzeug.security import check_password_hash
 
-from ..extensions import db, jwt, limiter
+from ..extensions import blocklist, db, jwt, limiter
 from ..models import User
 
 auth_bp = Blueprint("auth", __name__, url_prefix="/auth")
 
-# Store for revoked tokens (in production, use Redis or database)
-revoked_tokens = set()
+
+def _revoked_token_key(jti: str) -> str:
+    """Build the cache key marking a token as revoked."""
+    return f"jwt:revoked:{jti}"
+
+
+def revoke_token(jwt_payload: dict) -> None:
+    """Add a token to the blocklist until it would expire anyway.
+
+    Revoked tokens are stored in the blocklist cache (Redis in production),
+    so the entry disappears on its own once the token is no longer valid.
+    """
+    exp = jwt_payload.get("exp")
+    timeout = max(exp - int(time.time()), 1) if exp else 0
+    blocklist.set(_revoked_token_key(jwt_payload["jti"]), True, timeout=timeout)
+
+
+def revoke_session(jwt_payload: dict) -> None:
+    """Revoke the refresh token behind the given access or refresh token.
+
+    Access tokens carry the ``jti`` of the refresh token they were issued
+    from, so revoking it also rejects every access token of the session.
+    Access tokens issued before refresh tokens existed are revoked by their
+    own ``jti``.
+    """
+    if jwt_payload["type"] == "refresh" or "refresh_jti" not in jwt_payload:
+        revoke_token(jwt_payload)
+    else:
+        refresh_expires = current_app.config["JWT_REFRESH_TOKEN_EXPIRES"]
+        revoke_token(
+            {
+                "jti": jwt_payload["refresh_jti"],
+                # The refresh token was issued before this access token
+                "exp": jwt_payload["iat"] + int(refresh_expires.total_seconds()),
+            }
+        )
 
 
 @jwt.token_in_blocklist_loader
 def check_if_token_revoked(jwt_header, jwt_payload):
-    """Check if JWT token has been revoked."""
-    jti = jwt_payload["jti"]
-    return jti in revoked_tokens
+    """Check if the session a token belongs to has been revoked.
+
+    Every request does one blocklist lookup. Access tokens are checked
+    through the refresh token they were issued from (or their own ``jti``
+    when they have none), so logout and account deletion reject them
+    immediately.
+    """
+    jti = jwt_payload.get("refresh_jti", jwt_payload["jti"])
+    return blocklist.has(_revoked_token_key(jti))
+
+
+def _user_claims(auth) -> dict:
+    """Build the user claims embedded in access and refresh tokens.
+
+    The username is the stored one, not the login input, which may differ
+    in case on case-insensitive collations.
+    """
+    return {
+        "username": auth.username,
+        "role": auth.role,
+        "created_at": auth.created_at.isoformat(),
+    }
+
+
+def _create_access_token(user_id: int, claims: dict, refresh_jti: str) -> str:
+    """Create an access token tied to a refresh token."""
+    return create_access_token(
+        identity=str(user_id),
+        additional_claims={**claims, "refresh_jti": refresh_jti},
+    )
+
+
+def require_user(view):
+    """Load the token's user into ``g.user`` before running the view.
+
+    Responds with 404 when the user no longer exists. Apply below
+    ``@jwt_required()``.
+    """
+
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        g.user = db.session.get(User, int(get_jwt_identity()))
+
+        if not g.user:
+            return jsonify({"error": "User not found"}), 404
+
+        return view(*args, **kwargs)
+
+    return wrapper
 
 
 @auth_bp.route("/register", methods=["POST"])
@@ -50,7 +136,7 @@ def register():
 @auth_bp.route("/login", methods=["POST"])
 @limiter.limit("10 per minute")
 def login():
-    """Login and get JWT token."""
+    """Login and get JWT access and refresh tokens."""
     data = request.get_json()
 
     if not data:
@@ -62,31 +148,82 @@ def login():
     if not username or not password:
         return jsonify({"error": "Username and password required"}), 400
 
-    user = User.get_by_username(username)
+    auth = User.authenticate(username, password)
 
-    if not user or not user.check_password(password):
+    if not auth:
         return jsonify({"error": "Invalid credentials"}), 401
 
-    access_token = create_access_token(identity=str(user.id))
+    claims = _user_claims(auth)
+    refresh_token = create_refresh_token(
+        identity=str(auth.id), additional_claims=claims
+    )
+    access_token = _create_access_token(auth.id, claims, get_jti(refresh_token))
+
+    return (
+        jsonify(
+            {
+                "access_token": access_token,
+                "refresh_token": refresh_token,
+                "user_id": auth.id,
+            }
+        ),
+        200,
+    )
+
+
+@auth_bp.route("/refresh", methods=["POST"])
+@jwt_required(refresh=True)
+@limiter.limit("30 per minute")
+def refresh():
+    """Get a new access token using a refresh token."""
+    claims = get_jwt()
+    # Re-read the role so changes show up in the next access token
+    auth = User.get_auth_tuple(claims["username"])
+
+    if not auth or auth.id != int(claims["sub"]):
+        return jsonify({"error": "User not found"}), 401
 
-    return jsonify({"access_token": access_token, "user_id": user.id}), 200
+    access_token = _create_access_token(auth.id, _user_claims(auth), claims["jti"])
+
+    return jsonify({"access_token": access_token}), 200
 
 
 @auth_bp.route("/logout", methods=["POST"])
-@jwt_required()
+@jwt_required(verify_type=False)
 def logout():
-    """Logout and revoke JWT token."""
-    jti = get_jwt()["jti"]
-    revoked_tokens.add(jti)
+    """Logout and revoke the refresh token.
+
+    Accepts either the access or the refresh token of the session.
+    """
+    revoke_session(get_jwt())
     return jsonify({"message": "Successfully logged out"}), 200
 
 
 @auth_bp.route("/me", methods=["GET"])
 @jwt_required()
 def get_current_user():
-    """Get current authenticated user info."""
-    user_id = get_jwt_identity()
-    user = db.session.get(User, int(user_id))
+    """Get current authenticated user info.
+
+    Served from the token's claims; only tokens issued without them need
+    a database lookup. Tokens of a deleted account never get here: account
+    deletion revokes the session, and the blocklist loader rejects them.
+    """
+    claims = get_jwt()
+
+    if all(key in claims for key in ("username", "role", "created_at")):
+        return (
+            jsonify(
+                {
+                    "id": int(claims["sub"]),
+                    "username": claims["username"],
+                    "role": claims["role"],
+                    "created_at": claims["created_at"],
+                }
+            ),
+            200,
+        )
+
+    user = db.session.get(User, int(get_jwt_identity()))
 
     if not user:
         return jsonify({"error": "User not found"}), 404
@@ -98,7 +235,6 @@ def get_current_user():
                 "username": user.username,
                 "role": user.role,
                 "created_at": user.created_at.isoformat(),
-                "updated_at": user.updated_at.isoformat(),
             }
         ),
         200,
@@ -108,13 +244,10 @@ def get_current_user():
 @auth_bp.route("/me/email", methods=["PATCH"])
 @jwt_required()
 @limiter.limit("10 per minute")
+@require_user
 def update_email():
     """Update user's email address."""
-    user_id = get_jwt_identity()
-    user = db.session.get(User, int(user_id))
-
-    if not user:
-        return jsonify({"error": "User not found"}), 404
+    user = g.user
 
     data = request.get_json()
 
@@ -146,8 +279,13 @@ def update_email():
 @limiter.limit("10 per minute")
 def update_password():
     """Update user's password."""
-    user_id = get_jwt_identity()
-    user = db.session.get(User, int(user_id))
+    user_id = int(get_jwt_identity())
+    # Only the columns needed here; the new hash is written with a single UPDATE
+    user = db.session.execute(
+        db.select(User.username, User.email, User.password_hash).where(
+            User.id == user_id
+        )
+    ).first()
 
     if not user:
         return jsonify({"error": "User not found"}), 404
@@ -164,7 +302,7 @@ def update_password():
         return jsonify({"error": "Current password and new password are required"}), 400
 
     # Verify current password
-    if not user.check_password(current_password):
+    if not check_password_hash(user.password_hash, current_password):
         return jsonify({"error": "Current password is incorrect"}), 401
 
     # Validate new password strength
@@ -173,8 +311,13 @@ def update_password():
         return jsonify({"error": error_message}), 400
 
     # Update password
-    user.set_password(new_password)
+    db.session.execute(
+        db.update(User)
+        .where(User.id == user_id)
+        .values(password_hash=User.hash_password(new_password))
+    )
     db.session.commit()
+    User.forget_cached(user.username, user.email)
 
     return jsonify({"message": "Password updated successfully"}), 200
 
@@ -182,13 +325,10 @@ def update_password():
 @auth_bp.route("/me", methods=["DELETE"])
 @jwt_required()
 @limiter.limit("5 per minute")
+@require_user
 def delete_account():
     """Delete user account and all associated data."""
-    user_id = get_jwt_identity()
-    user = db.session.get(User, int(user_id))
-
-    if not user:
-        return jsonify({"error": "User not found"}), 404
+    user = g.user
 
     data = request.get_json()
 
@@ -204,9 +344,8 @@ def delete_account():
     if not user.check_password(password):
         return jsonify({"error": "Password is incorrect"}), 401
 
-    # Revoke current token
-    jti = get_jwt()["jti"]
-    revoked_tokens.add(jti)
+    # Revoke the session's refresh token
+    revoke_session(get_jwt())
 
     # Delete user (cascade will delete menus and dishes)
     db.session.delete(user)
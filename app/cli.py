@@ -1,10 +1,13 @@
 """CLI commands for the application."""
 
+import time
+
 import click
 from flask import Flask
 from flask.cli import with_appcontext
+from werkzeug.security import generate_password_hash
 
-from .extensions import db
+from .db_init import seed_default_data
 from .models import User
 
 
@@ -54,6 +57,31 @@ def init_cli(app: Flask):
         click.echo(f"  Admin: {user.is_admin}")
         click.echo(f"  Manager: {user.is_manager}")
 
+    @app.cli.command("benchmark-password-hash")
+    @click.option("--rounds", default=5, show_default=True, help="Hashes to time")
+    @click.option(
+        "--method",
+        default=None,
+        help="Werkzeug hash method (defaults to PASSWORD_HASH_METHOD)",
+    )
+    def benchmark_password_hash(rounds: int, method: str | None):
+        """Time password hashing to calibrate PASSWORD_HASH_METHOD.
+
+        Aim for roughly 250ms per hash on the production hardware.
+
+        Usage:
+            flask benchmark-password-hash
+            flask benchmark-password-hash --method scrypt:65536:8:1
+        """
+        method = method or app.config["PASSWORD_HASH_METHOD"]
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            generate_password_hash("benchmark-password-123", method=method)
+        elapsed = (time.perf_counter() - start) / rounds
+
+        click.echo(f"{method}: {elapsed * 1000:.1f} ms per hash")
+
     @app.cli.command("list-users")
     @with_appcontext
     def list_users():
@@ -72,60 +100,5 @@ def init_cli(app: Flask):
     @with_appcontext
     def seed_attributes():
         """Seed default emotions, textures, and shapes."""
-        from .models import Emotion, Shape, Texture
-
-        emotions = [
-            "joy",
-            "anger",
-            "fear",
-            "sadness",
-            "surprise",
-            "satisfaction",
-            "gratitude",
-            "hope",
-            "love",
-            "serenity",
-            "euphoria",
-            "conviviality",
-            "playfulness",
-        ]
-
-        textures = [
-            "rough",
-            "soft",
-            "hard",
-            "creamy",
-            "crunchy",
-            "liquid",
-            "viscous",
-            "solid",
-            "hollow",
-            "dense",
-            "porous",
-            "airy",
-        ]
-
-        shapes = [
-            "sharp",
-            "round",
-            "smooth",
-            "symmetric",
-            "asymmetric",
-            "compact",
-            "loose",
-        ]
-
-        for name in emotions:
-            if not Emotion.query.filter_by(description=name).first():
-                db.session.add(Emotion(description=name))
-
-        for name in textures:
-            if not Texture.query.filter_by(description=name).first():
-                db.session.add(Texture(description=name))
-
-        for name in shapes:
-            if not Shape.query.filter_by(description=name).first():
-                db.session.add(Shape(description=name))
-
-        db.session.commit()
+        seed_default_data(app)
         click.echo("✓ Attributes seeded successfully.")
@@ -1,6 +1,7 @@
 """Application configuration."""
 
 import os
+import sys
 from datetime import timedelta
 from pathlib import Path
 
@@ -40,22 +41,60 @@ def get_database_url() -> str:
     return db_url
 
 
+def get_engine_options(db_url: str) -> dict:
+    """Get SQLAlchemy engine options suited to the database backend.
+
+    Server databases (PostgreSQL, MariaDB/MySQL) get a larger connection pool
+    so concurrent requests reuse warm connections instead of waiting for one.
+    The defaults (10 + 10 overflow per process) keep the 4 gunicorn workers
+    under PostgreSQL's default limit of 100 connections.
+    SQLite does not use a sized connection pool, so only pre-ping is set.
+    All backends get a larger compiled statement cache (SQLAlchemy's default
+    is 500 entries) so every ORM query the app issues stays compiled.
+    """
+    options = {
+        "pool_pre_ping": True,  # Check connection before using
+        "query_cache_size": int(os.environ.get("DB_QUERY_CACHE_SIZE", 1200)),
+    }
+    if not db_url.startswith("sqlite"):
+        options.update(
+            {
+                "pool_size": int(os.environ.get("DB_POOL_SIZE", 10)),
+                "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", 10)),
+                "pool_recycle": int(os.environ.get("DB_POOL_RECYCLE", 1800)),
+            }
+        )
+    return options
+
+
 class Config:
     """Base configuration."""
 
     SECRET_KEY = os.environ.get("SECRET_KEY", "dev-secret-key")
     JWT_SECRET_KEY = os.environ.get("JWT_SECRET_KEY", "dev-jwt-secret")
-    JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)
+    # Access tokens carry the user's role, so keep them short-lived: role
+    # changes reach clients when they renew them at /auth/refresh
+    JWT_ACCESS_TOKEN_EXPIRES = timedelta(
+        minutes=int(os.environ.get("JWT_ACCESS_TOKEN_MINUTES", "10"))
+    )
+    JWT_REFRESH_TOKEN_EXPIRES = timedelta(
+        days=int(os.environ.get("JWT_REFRESH_TOKEN_DAYS", "30"))
+    )
     SQLALCHEMY_DATABASE_URI = get_database_url()
     SQLALCHEMY_TRACK_MODIFICATIONS = False
-    SQLALCHEMY_ENGINE_OPTIONS = {
-        "pool_pre_ping": True,  # Check connection before using
-    }
+    SQLALCHEMY_ENGINE_OPTIONS = get_engine_options(SQLALCHEMY_DATABASE_URI)
     RATELIMIT_STORAGE_URI = os.environ.get("RATELIMIT_STORAGE_URI", "memory://")
+    # Moving window keeps limits exact at window boundaries; with a shared
+    # storage (e.g. redis://) limits are enforced across all workers
+    RATELIMIT_STRATEGY = os.environ.get("RATELIMIT_STRATEGY", "moving-window")
     RATELIMIT_DEFAULT = "200 per day;50 per hour"
     WTF_CSRF_ENABLED = True
     FLASK_ADMIN_SWATCH = "cerulean"
 
+    # Werkzeug password hashing method (memory-hard scrypt, N=2^15, r=8, p=1).
+    # Use `flask benchmark-password-hash` to check its cost on your hardware.
+    PASSWORD_HASH_METHOD = os.environ.get("PASSWORD_HASH_METHOD", "scrypt:32768:8:1")
+
     # Auto-initialize database on startup
     AUTO_INIT_DB = os.environ.get("AUTO_INIT_DB", "true").lower() in (
         "true",
@@ -63,9 +102,26 @@ class Config:
         "yes",
     )
 
-    # Cache configuration
-    CACHE_TYPE = "SimpleCache"
+    # Cache configuration (use RedisCache when running multiple workers so
+    # cached data and revoked tokens are shared between them)
+    CACHE_TYPE = os.environ.get("CACHE_TYPE", "SimpleCache")
+    CACHE_REDIS_URL = os.environ.get("CACHE_REDIS_URL")
     CACHE_DEFAULT_TIMEOUT = 300
+    # The JWT blocklist uses the same backend under its own key prefix, with
+    # no size limit: SimpleCache drops entries past 500, and a dropped
+    # revocation would make the token valid again
+    JWT_BLOCKLIST_CACHE = {
+        "CACHE_KEY_PREFIX": "jwt_blocklist_",
+        "CACHE_THRESHOLD": sys.maxsize,
+    }
+    # Cache user lookups (login, registration, refresh). Password hashes and
+    # roles are invalidated in the cache of the worker that changed them, so
+    # only enable this with a backend shared by all workers (RedisCache).
+    USER_LOOKUP_CACHE = os.environ.get("USER_LOOKUP_CACHE", "false").lower() in (
+        "true",
+        "1",
+        "yes",
+    )
 
 
 class DevelopmentConfig(Config):
@@ -84,10 +140,15 @@ class TestingConfig(Config):
     """Testing configuration."""
 
     TESTING = True
+    # Fixed HMAC signing so tests don't depend on JWT settings in the environment
+    JWT_SECRET_KEY = "testing-jwt-secret-key-32-bytes!"
+    JWT_ALGORITHM = "HS256"
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    SQLALCHEMY_ENGINE_OPTIONS = get_engine_options(SQLALCHEMY_DATABASE_URI)
     WTF_CSRF_ENABLED = False
     CACHE_TYPE = "SimpleCache"
     CACHE_DEFAULT_TIMEOUT = 0  # Disable caching by default in tests
+    PASSWORD_HASH_METHOD = "pbkdf2:sha256:1"  # Fast hashing, tests only
     AUTO_INIT_DB = False  # Don't auto-initialize database in tests
 
 
@@ -4,11 +4,14 @@ This module handles automatic database creation, table setup,
 and seeding of default data when the application starts.
 """
 
+import hashlib
 import logging
 import os
+from pathlib import Path
 
 from flask import Flask
 from sqlalchemy import inspect, text
+from sqlalchemy.dialects import mysql, postgresql, sqlite
 from sqlalchemy.exc import IntegrityError, OperationalError, ProgrammingError
 
 from .extensions import db
@@ -34,7 +37,7 @@ def init_database(app: Flask) -> bool:
             if _database_needs_init():
                 logger.info("Database needs initialization...")
                 _create_tables()
-                _seed_default_data(app)
+                seed_default_data(app)
                 _create_admin_user(app)
                 logger.info("Database initialization completed successfully!")
                 return True
@@ -46,6 +49,56 @@ def init_database(app: Flask) -> bool:
             raise
 
 
+def init_database_once(app: Flask) -> bool:
+    """Initialize the database unless an earlier startup already did.
+
+    Once the database is known to be set up, a marker file is written to the
+    instance folder, so later startups and every other gunicorn worker skip
+    the full table inspection and user count. The marker is only trusted
+    while the user table still exists, so a reset database is set up again.
+
+    Args:
+        app: Flask application instance
+
+    Returns:
+        bool: True if initialization was performed
+    """
+    marker = _init_marker_path(app)
+    if marker is not None and marker.exists() and _user_table_exists(app):
+        logger.info("Database already initialized (marker found), skipping check.")
+        return False
+
+    performed = init_database(app)
+
+    if marker is not None:
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.touch()
+    return performed
+
+
+def _init_marker_path(app: Flask) -> Path | None:
+    """Get the marker file for the configured database.
+
+    The file name includes a hash of the database URL, so pointing the app at
+    another database triggers a fresh check. In-memory databases don't
+    survive a restart and never get a marker.
+    """
+    db_url = app.config["SQLALCHEMY_DATABASE_URI"]
+    if ":memory:" in db_url:
+        return None
+    digest = hashlib.sha256(db_url.encode()).hexdigest()[:16]
+    return Path(app.instance_path) / f".db_initialized_{digest}"
+
+
+def _user_table_exists(app: Flask) -> bool:
+    """Check with a single query that the database still has the user table."""
+    with app.app_context():
+        try:
+            return inspect(db.engine).has_table("user")
+        except (OperationalError, ProgrammingError):
+            return False
+
+
 def _database_needs_init() -> bool:
     """Check if database needs initialization.
 
@@ -87,8 +140,11 @@ def _create_tables():
     logger.info("Tables created successfully")
 
 
-def _seed_default_data(app: Flask):
-    """Seed default attributes (emotions, textures, shapes)."""
+def seed_default_data(app: Flask):
+    """Seed default attributes (emotions, textures, shapes).
+
+    Attributes that already exist are kept, so this is safe to run again.
+    """
     from .models import Emotion, Shape, Texture
 
     logger.info("Seeding default attributes...")
@@ -134,22 +190,47 @@ def _seed_default_data(app: Flask):
         "loose",
     ]
 
-    for description in emotions:
-        if not Emotion.query.filter_by(description=description).first():
-            db.session.add(Emotion(description=description))
-
-    for description in textures:
-        if not Texture.query.filter_by(description=description).first():
-            db.session.add(Texture(description=description))
-
-    for description in shapes:
-        if not Shape.query.filter_by(description=description).first():
-            db.session.add(Shape(description=description))
+    _insert_missing(Emotion, emotions)
+    _insert_missing(Texture, textures)
+    _insert_missing(Shape, shapes)
 
     db.session.commit()
     logger.info("Default attributes seeded successfully")
 
 
+def _insert_missing(model, descriptions: list[str]):
+    """Insert attribute descriptions that don't exist yet.
+
+    Uses a single INSERT that skips duplicates where the database supports
+    it, which is also safe when several workers seed at the same time.
+    """
+    dialect = db.session.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        stmt = postgresql.insert(model).on_conflict_do_nothing(
+            index_elements=["description"]
+        )
+    elif dialect == "sqlite":
+        stmt = sqlite.insert(model).on_conflict_do_nothing(
+            index_elements=["description"]
+        )
+    elif dialect in ("mysql", "mariadb"):
+        stmt = mysql.insert(model).prefix_with("IGNORE")
+    else:
+        # One lookup for all descriptions instead of one per row
+        existing = set(
+            db.session.scalars(
+                db.select(model.description).where(model.description.in_(descriptions))
+            )
+        )
+        db.session.add_all(
+            model(description=d) for d in descriptions if d not in existing
+        )
+        return
+
+    db.session.execute(stmt.values([{"description": d} for d in descriptions]))
+
+
 def _create_admin_user(app: Flask):
     """Create default admin user from environment variables."""
     from .models import User
@@ -159,11 +240,11 @@ def _create_admin_user(app: Flask):
     email = os.environ.get("ADMIN_EMAIL", "admin@example.com")
 
     # Check if admin already exists (by username or email)
-    if User.get_by_username(username):
+    if db.session.scalar(db.select(db.exists().where(User.username == username))):
         logger.info(f"Admin user '{username}' already exists")
         return
 
-    if email and User.query.filter_by(email=email).first():
+    if email and db.session.scalar(db.select(db.exists().where(User.email == email))):
         logger.info(f"User with email '{email}' already exists")
         return
 
@@ -1,11 +1,15 @@
 """Flask extensions initialization."""
 
+import functools
 import os
+import time
 
 from flask_babel import Babel
 from flask_caching import Cache
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager
+from flask_jwt_extended.config import config as jwt_config
+from flask_jwt_extended.default_callbacks import default_decode_key_callback
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from flask_login import LoginManager
@@ -21,8 +25,65 @@ migrate = Migrate()
 # Login manager
 login_manager = LoginManager()
 
+
+class CachingJWTManager(JWTManager):
+    """JWTManager that remembers the claims of recently verified tokens.
+
+    Clients send the same access token with every request until it expires,
+    so the signature is verified once and the decoded claims are reused.
+    Expiry is still checked on every request, and the blocklist loader runs
+    after decoding, so revoked refresh tokens are rejected as before.
+
+    This overrides a private flask-jwt-extended method, which is why the
+    dependency is pinned to a minor version.
+    """
+
+    def _decode_jwt_from_config(
+        self, encoded_token: str, csrf_value=None, allow_expired: bool = False
+    ) -> dict:
+        if (
+            csrf_value is not None
+            or allow_expired
+            or self._decode_key_callback is not default_decode_key_callback
+        ):
+            # A custom decode_key_loader may pick the key per token
+            return super()._decode_jwt_from_config(
+                encoded_token, csrf_value, allow_expired
+            )
+
+        claims = self._verified_claims(encoded_token, _decode_settings())
+        if claims.get("exp") is not None and claims["exp"] <= time.time():
+            # Let PyJWT raise the usual expired signature error
+            return super()._decode_jwt_from_config(encoded_token)
+        return dict(claims)
+
+    @functools.lru_cache(maxsize=4096)  # noqa: B019 - the manager is a singleton
+    def _verified_claims(self, encoded_token: str, settings: tuple) -> dict:
+        """Verify a token and decode its claims.
+
+        ``settings`` is only part of the cache key, see ``_decode_settings``.
+        """
+        return super()._decode_jwt_from_config(encoded_token)
+
+
+def _decode_settings() -> tuple:
+    """Get the JWT settings that affect verification, as a hashable tuple."""
+    audience = jwt_config.decode_audience
+    if audience is not None and not isinstance(audience, str):
+        audience = tuple(audience)
+    return (
+        jwt_config.decode_key,
+        tuple(jwt_config.decode_algorithms),
+        audience,
+        jwt_config.decode_issuer,
+        jwt_config.leeway,
+        jwt_config.identity_claim_key,
+        jwt_config.verify_sub,
+    )
+
+
 # JWT
-jwt = JWTManager()
+jwt = CachingJWTManager()
 
 # Babel
 babel = Babel()
@@ -34,7 +95,12 @@ cors = CORS()
 limiter = Limiter(
     key_func=get_remote_address,
     storage_uri=os.environ.get("RATELIMIT_STORAGE_URI", "memory://"),
+    strategy=os.environ.get("RATELIMIT_STRATEGY", "moving-window"),
 )
 
 # Cache
 cache = Cache()
+
+# JWT blocklist, kept out of the general cache so revocations are never
+# evicted to make room for other entries (see JWT_BLOCKLIST_CACHE)
+blocklist = Cache()
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import enum
 import typing as tp
-from dataclasses import dataclass
 from datetime import datetime  # noqa: TC003
 
 from sqlalchemy import DateTime, Enum, ForeignKey, Integer, String, func
@@ -24,7 +23,6 @@ class MenuStatus(enum.Enum):
     SUBMITTED = "submitted"
 
 
-@dataclass
 class Menu(db.Model):
     """Restaurant menu model."""
 
@@ -50,7 +48,6 @@ class Menu(db.Model):
     dishes: Mapped[list[Dish]] = relationship(cascade="all, delete-orphan")
 
 
-@dataclass
 class Dish(db.Model):
     """Dish model with sensory attributes."""
 
@@ -134,8 +131,8 @@ class DishBuilder:
         return self
 
     def with_colors(self, colors: list[str]) -> DishBuilder:
-        for i, color in enumerate(colors[:3]):
-            setattr(self._dish, f"color{i + 1}", color)
+        padded = [*colors[:3], None, None, None]
+        self._dish.color1, self._dish.color2, self._dish.color3 = padded[:3]
         return self
 
     def with_emotions(self, emotions: list[Emotion]) -> DishBuilder:
@@ -2,29 +2,109 @@
 
 from __future__ import annotations
 
+import functools
 import re
 import typing as tp
 from datetime import datetime  # noqa: TC003
 
+from flask import current_app
 from flask_login import UserMixin
-from sqlalchemy import Boolean, DateTime, Integer, String, func
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import Boolean, DateTime, Integer, String, event, func, inspect
+from sqlalchemy.orm import (
+    Mapped,
+    Session,
+    make_transient_to_detached,
+    mapped_column,
+    object_session,
+    relationship,
+)
+from sqlalchemy.orm.util import identity_key
 from werkzeug.security import check_password_hash, generate_password_hash
 
-from ..extensions import db
+from ..extensions import cache, db
 
 if tp.TYPE_CHECKING:
     from .menu import Menu
 
+# With USER_LOOKUP_CACHE enabled, lookups by username/email are cached
+# (cache-aside) to skip a DB round-trip on the auth endpoints. Misses are
+# cached too, but for a shorter time.
+# Cached entries hold plain column values, never ORM objects.
+# Keys of users changed in a transaction wait in session.info until commit.
+_CACHE_TIMEOUT = 300
+_CACHE_MISS_TIMEOUT = 30
+_PENDING_CACHE_KEYS = "user_cache_keys"
+_CACHED_COLUMNS = (
+    "id",
+    "username",
+    "email",
+    "password_hash",
+    "is_admin",
+    "is_manager",
+    "created_at",
+    "updated_at",
+)
+
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+
+def _role(is_admin: bool, is_manager: bool) -> str:
+    """Get the role name for the given flags."""
+    if is_admin:
+        return "admin"
+    elif is_manager:
+        return "manager"
+    return "user"
+
+
+@functools.cache
+def dummy_password_hash(method: str) -> str:
+    """Hash of a throwaway password, checked when a username is unknown.
+
+    create_app computes it at startup, so the first login with an unknown
+    username doesn't also pay for hashing it.
+    """
+    return generate_password_hash("dummy-password", method=method)
+
+
+class AuthTuple(tp.NamedTuple):
+    """Lightweight row with the columns needed to authenticate a user.
+
+    Also holds the stored username and creation date for the token claims.
+    """
+
+    id: int
+    username: str
+    password_hash: str
+    is_admin: bool
+    is_manager: bool
+    created_at: datetime
+
+    @property
+    def role(self) -> str:
+        """Get user role as string."""
+        return _role(self.is_admin, self.is_manager)
+
+    def check_password(self, password: str) -> bool:
+        """Verify the user's password."""
+        return check_password_hash(self.password_hash, password)
+
 
 class User(db.Model, UserMixin):
     """User model for authentication and authorization."""
 
     __tablename__ = "user"
+    # Never reuse the id of a deleted user on SQLite: tokens issued to the
+    # deleted account must not match whoever registers next
+    __table_args__ = {"sqlite_autoincrement": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    username: Mapped[str] = mapped_column(String, unique=True, nullable=False)
-    email: Mapped[str | None] = mapped_column(String, unique=True, nullable=True)
+    username: Mapped[str] = mapped_column(
+        String, unique=True, nullable=False, active_history=True
+    )
+    email: Mapped[str | None] = mapped_column(
+        String, unique=True, nullable=True, active_history=True
+    )
     password_hash: Mapped[str] = mapped_column(String, nullable=False)
     is_admin: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     is_manager: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
@@ -43,7 +123,14 @@ class User(db.Model, UserMixin):
 
     def set_password(self, password: str) -> None:
         """Hash and set the user's password."""
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = self.hash_password(password)
+
+    @staticmethod
+    def hash_password(password: str) -> str:
+        """Hash a password with the configured method."""
+        return generate_password_hash(
+            password, method=current_app.config["PASSWORD_HASH_METHOD"]
+        )
 
     def check_password(self, password: str) -> bool:
         """Verify the user's password."""
@@ -52,11 +139,7 @@ class User(db.Model, UserMixin):
     @property
     def role(self) -> str:
         """Get user role as string."""
-        if self.is_admin:
-            return "admin"
-        elif self.is_manager:
-            return "manager"
-        return "user"
+        return _role(self.is_admin, self.is_manager)
 
     @classmethod
     def create(
@@ -82,20 +165,94 @@ class User(db.Model, UserMixin):
     @classmethod
     def get_by_username(cls, username: str) -> User | None:
         """Find user by username."""
-        return db.session.execute(
-            db.select(cls).where(cls.username == username)
-        ).scalar()
+        row = cls._get_cached_row(
+            f"user:username:{username}", _CACHED_COLUMNS, cls.username == username
+        )
+        return cls._from_row(row) if row else None
 
     @classmethod
     def get_by_email(cls, email: str) -> User | None:
         """Find user by email."""
-        return db.session.execute(db.select(cls).where(cls.email == email)).scalar()
+        row = cls._get_cached_row(
+            f"user:email:{email}", _CACHED_COLUMNS, cls.email == email
+        )
+        return cls._from_row(row) if row else None
+
+    @classmethod
+    def get_auth_tuple(cls, username: str) -> AuthTuple | None:
+        """Find only the columns needed to authenticate a user by username."""
+        row = cls._get_cached_row(
+            f"user:auth:{username}", AuthTuple._fields, cls.username == username
+        )
+        return AuthTuple(*row) if row else None
+
+    @classmethod
+    def authenticate(cls, username: str, password: str) -> AuthTuple | None:
+        """Return the user's auth row if username and password are valid.
+
+        When the username is unknown, the password is still checked against a
+        dummy hash so the response time doesn't reveal which usernames exist.
+        """
+        auth = cls.get_auth_tuple(username)
+        if auth is None:
+            method = current_app.config["PASSWORD_HASH_METHOD"]
+            check_password_hash(dummy_password_hash(method), password)
+            return None
+        return auth if auth.check_password(password) else None
+
+    @staticmethod
+    def forget_cached(username: str | None = None, email: str | None = None) -> None:
+        """Drop the cached lookups for a username and/or email.
+
+        ORM changes are handled by the events at the bottom of this module;
+        call this after committing Core UPDATE/DELETE statements on the table.
+        """
+        if current_app.config["USER_LOOKUP_CACHE"]:
+            _delete_cache_keys(_cache_keys(username, email))
+
+    @classmethod
+    def _get_cached_row(
+        cls, key: str, columns: tuple[str, ...], criterion
+    ) -> tuple | None:
+        """Select some columns of a single user through the cache (cache-aside).
+
+        The cache is skipped unless USER_LOOKUP_CACHE is enabled.
+        """
+        if not current_app.config["USER_LOOKUP_CACHE"]:
+            return cls._select_row(columns, criterion)
+
+        cached = cache.get(key)
+        if cached is None:
+            row = cls._select_row(columns, criterion)
+            cached = row or False
+            timeout = _CACHE_TIMEOUT if row else _CACHE_MISS_TIMEOUT
+            cache.set(key, cached, timeout=timeout)
+        return cached or None
+
+    @classmethod
+    def _select_row(cls, columns: tuple[str, ...], criterion) -> tuple | None:
+        """Select some columns of a single user from the database."""
+        select = db.select(*(getattr(cls, column) for column in columns))
+        row = db.session.execute(select.where(criterion)).first()
+        return tuple(row) if row else None
+
+    @classmethod
+    def _from_row(cls, row: tuple) -> User:
+        """Build a persistent user from its column values without another query."""
+        values = dict(zip(_CACHED_COLUMNS, row, strict=True))
+        existing = db.session.identity_map.get(identity_key(cls, values["id"]))
+        if existing is not None:
+            return existing
+
+        user = cls(**values)
+        make_transient_to_detached(user)
+        db.session.add(user)
+        return user
 
     @staticmethod
     def validate_email(email: str) -> bool:
         """Validate email format."""
-        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        return bool(re.match(pattern, email))
+        return bool(_EMAIL_RE.match(email))
 
     @staticmethod
     def validate_password_strength(password: str) -> tuple[bool, str]:
@@ -107,8 +264,65 @@ class User(db.Model, UserMixin):
         """
         if len(password) < 8:
             return False, "Password must be at least 8 characters long"
-        if not any(c.isdigit() for c in password):
+
+        # Single pass over the password, stopping once both classes are seen
+        has_digit = has_letter = False
+        for c in password:
+            if c.isdigit():
+                has_digit = True
+            elif c.isalpha():
+                has_letter = True
+            if has_digit and has_letter:
+                break
+
+        if not has_digit:
             return False, "Password must contain at least one digit"
-        if not any(c.isalpha() for c in password):
+        if not has_letter:
             return False, "Password must contain at least one letter"
         return True, ""
+
+
+def _cache_keys(username: str | None, email: str | None) -> list[str]:
+    """Get the cache keys of the lookups for a username and/or email."""
+    keys = [f"user:email:{email}"] if email else []
+    if username:
+        keys += [f"user:username:{username}", f"user:auth:{username}"]
+    return keys
+
+
+def _delete_cache_keys(keys) -> None:
+    """Delete cache keys one by one: delete_many stops at the first missing key."""
+    for key in keys:
+        cache.delete(key)
+
+
+@event.listens_for(User, "after_insert")
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _collect_user_cache_keys(mapper, connection, target: User) -> None:
+    """Remember the cached lookups of a changed user until the commit.
+
+    Deleting them at flush time would let a concurrent lookup re-cache the
+    old, still committed row.
+    """
+    if not current_app.config["USER_LOOKUP_CACHE"]:
+        return
+    state = inspect(target)
+    keys = object_session(target).info.setdefault(_PENDING_CACHE_KEYS, set())
+    for username in {state.dict.get("username"), *state.attrs.username.history.deleted}:
+        keys.update(_cache_keys(username, None))
+    for email in {state.dict.get("email"), *state.attrs.email.history.deleted}:
+        keys.update(_cache_keys(None, email))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_user_cache(session: Session) -> None:
+    """Drop the cached lookups of users changed by the committed transaction."""
+    _delete_cache_keys(session.info.pop(_PENDING_CACHE_KEYS, ()))
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_user_cache_keys(session: Session, previous_transaction) -> None:
+    """Forget the pending keys when the whole transaction is rolled back."""
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_CACHE_KEYS, None)
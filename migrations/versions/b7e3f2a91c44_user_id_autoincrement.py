@@ -0,0 +1,37 @@
+"""Never reuse user ids on SQLite
+
+Revision ID: b7e3f2a91c44
+Revises: 0ac02bec0639
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "b7e3f2a91c44"
+down_revision = "0ac02bec0639"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Other backends never hand out the id of a deleted row again
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    with op.batch_alter_table(
+        "user", recreate="always", table_kwargs={"sqlite_autoincrement": True}
+    ):
+        pass
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    with op.batch_alter_table(
+        "user", recreate="always", table_kwargs={"sqlite_autoincrement": False}
+    ):
+        pass
@@ -1,26 +1,53 @@
 """Pytest configuration and fixtures."""
 
+from unittest.mock import patch
+
 import pytest
 from flask_jwt_extended import create_access_token
 
 from app import create_app
 from app.config import TestingConfig
-from app.extensions import cache, db
-from app.models import Dish, Emotion, Menu, Shape, Texture, User
+from app.extensions import blocklist, cache, db, limiter
+from app.models import Dish, Emotion, Menu, MenuStatus, Shape, Texture, User
 
 
-@pytest.fixture(scope="function")
-def app():
-    """Create and configure a test application instance."""
+@pytest.fixture(scope="session")
+def _app():
+    """Create the test application and its database schema once per session."""
     app = create_app(TestingConfig)
 
     with app.app_context():
         db.create_all()
+
+    yield app
+
+    with app.app_context():
+        db.drop_all()
+
+
+@pytest.fixture(scope="function")
+def app(_app):
+    """Provide the test application with a clean database, cache and limits.
+
+    The schema is created once per session; rows written by a test are
+    deleted afterwards instead of dropping and recreating every table.
+    """
+    with _app.app_context():
         cache.clear()  # Clear cache before each test
-        yield app
+        blocklist.clear()
+        limiter.reset()
+        yield _app
         cache.clear()  # Clear cache after each test
+        blocklist.clear()
         db.session.remove()
-        db.drop_all()
+        _delete_all_rows()
+
+
+def _delete_all_rows():
+    """Empty every table, children before parents."""
+    with db.engine.begin() as connection:
+        for table in reversed(db.metadata.sorted_tables):
+            connection.execute(table.delete())
 
 
 @pytest.fixture(scope="function")
@@ -35,6 +62,13 @@ def runner(app):
     return app.test_cli_runner()
 
 
+@pytest.fixture
+def user_lookup_cache(app):
+    """Enable the user lookup cache, which is off by default."""
+    with patch.dict(app.config, {"USER_LOOKUP_CACHE": True}):
+        yield
+
+
 @pytest.fixture
 def test_user(app):
     """Create a test user and return user_id."""
@@ -80,6 +114,15 @@ def admin_auth_headers(app, admin_user):
         return {"Authorization": f"Bearer {access_token}"}
 
 
+@pytest.fixture
+def other_user_headers(app):
+    """Get JWT authorization headers for a second, unrelated user."""
+    with app.app_context():
+        user = User.create(username="other", password="password123")
+        access_token = create_access_token(identity=str(user.id))
+        return {"Authorization": f"Bearer {access_token}"}
+
+
 @pytest.fixture
 def test_menu(app, test_user):
     """Create a test menu and return menu_id."""
@@ -95,6 +138,22 @@ def test_menu(app, test_user):
         return menu_id
 
 
+@pytest.fixture
+def submitted_menu(app, test_user):
+    """Create an already submitted menu and return menu_id."""
+    with app.app_context():
+        menu = Menu(
+            title="Submitted Menu",
+            description="A submitted menu",
+            status=MenuStatus.SUBMITTED,
+            owner_id=test_user,
+        )
+        db.session.add(menu)
+        db.session.commit()
+        menu_id = menu.id
+        return menu_id
+
+
 @pytest.fixture
 def test_dish(app, test_menu):
     """Create a test dish and return dish_id."""
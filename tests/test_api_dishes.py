@@ -28,19 +28,13 @@ class TestGetDishes:
 
         assert response.status_code == 404
 
-    def test_get_dishes_unauthorized_menu(self, client, test_menu, app):
+    def test_get_dishes_unauthorized_menu(self, client, test_menu, other_user_headers):
         """Test getting dishes from another user's menu."""
-        from flask_jwt_extended import create_access_token
-
-        from app.models import User
-
-        with app.app_context():
-            other_user = User.create(username="other", password="password123")
-            token = create_access_token(identity=str(other_user.id))
-            headers = {"Authorization": f"Bearer {token}"}
+        response = client.get(
+            f"/api/menus/{test_menu}/dishes", headers=other_user_headers
+        )
 
-            response = client.get(f"/api/menus/{test_menu}/dishes", headers=headers)
-            assert response.status_code == 403
+        assert response.status_code == 403
 
 
 class TestCreateDish:
@@ -92,23 +86,15 @@ class TestCreateDish:
 
         assert response.status_code == 404
 
-    def test_create_dish_unauthorized_menu(self, client, test_menu, app):
+    def test_create_dish_unauthorized_menu(self, client, test_menu, other_user_headers):
         """Test creating dish in another user's menu."""
-        from flask_jwt_extended import create_access_token
-
-        from app.models import User
-
-        with app.app_context():
-            other_user = User.create(username="other", password="password123")
-            token = create_access_token(identity=str(other_user.id))
-            headers = {"Authorization": f"Bearer {token}"}
+        response = client.post(
+            f"/api/menus/{test_menu}/dishes",
+            headers=other_user_headers,
+            json={"name": "Hacked Dish"},
+        )
 
-            response = client.post(
-                f"/api/menus/{test_menu}/dishes",
-                headers=headers,
-                json={"name": "Hacked Dish"},
-            )
-            assert response.status_code == 403
+        assert response.status_code == 403
 
     def test_create_dish_no_data(self, client, auth_headers, test_menu):
         """Test creating dish with no data."""
@@ -165,23 +151,15 @@ class TestUpdateDish:
 
         assert response.status_code == 404
 
-    def test_update_dish_unauthorized(self, client, test_dish, app):
+    def test_update_dish_unauthorized(self, client, test_dish, other_user_headers):
         """Test updating another user's dish."""
-        from flask_jwt_extended import create_access_token
-
-        from app.models import User
-
-        with app.app_context():
-            other_user = User.create(username="other", password="password123")
-            token = create_access_token(identity=str(other_user.id))
-            headers = {"Authorization": f"Bearer {token}"}
+        response = client.put(
+            f"/api/dishes/{test_dish}",
+            headers=other_user_headers,
+            json={"name": "Hacked"},
+        )
 
-            response = client.put(
-                f"/api/dishes/{test_dish}",
-                headers=headers,
-                json={"name": "Hacked"},
-            )
-            assert response.status_code == 403
+        assert response.status_code == 403
 
 
 class TestDeleteDish:
@@ -207,16 +185,8 @@ class TestDeleteDish:
 
         assert response.status_code == 404
 
-    def test_delete_dish_unauthorized(self, client, test_dish, app):
+    def test_delete_dish_unauthorized(self, client, test_dish, other_user_headers):
         """Test deleting another user's dish."""
-        from flask_jwt_extended import create_access_token
-
-        from app.models import User
-
-        with app.app_context():
-            other_user = User.create(username="other", password="password123")
-            token = create_access_token(identity=str(other_user.id))
-            headers = {"Authorization": f"Bearer {token}"}
+        response = client.delete(f"/api/dishes/{test_dish}", headers=other_user_headers)
 
-            response = client.delete(f"/api/dishes/{test_dish}", headers=headers)
-            assert response.status_code == 403
+        assert response.status_code == 403
@@ -1,5 +1,8 @@
 """Tests for authentication endpoints."""
 
+import time
+from unittest.mock import patch
+
 
 class TestRegistration:
     """Tests for user registration."""
@@ -119,23 +122,163 @@ class TestLogout:
 
         assert response.status_code == 401
 
-    def test_token_revoked_after_logout(self, client, app, test_user):
-        """Test that token is revoked after logout."""
-        # Login to get token
+    def test_refresh_token_revoked_after_logout(self, client, test_user):
+        """Test that logging out with the access token revokes the session."""
+        # Login to get tokens
         login_response = client.post(
             "/auth/login",
             json={"username": "testuser", "password": "testpassword123"},
         )
-        token = login_response.get_json()["access_token"]
-        headers = {"Authorization": f"Bearer {token}"}
+        tokens = login_response.get_json()
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
 
         # Logout
         client.post("/auth/logout", headers=headers)
 
-        # Try to use token again
+        # Try to get a new access token
+        response = client.post(
+            "/auth/refresh",
+            headers={"Authorization": f"Bearer {tokens['refresh_token']}"},
+        )
+        assert response.status_code == 401
+
+        # The access token of the session is rejected too
         response = client.get("/auth/me", headers=headers)
         assert response.status_code == 401
 
+    def test_logout_with_refresh_token(self, client, test_user):
+        """Test that logout also accepts the refresh token."""
+        login_response = client.post(
+            "/auth/login",
+            json={"username": "testuser", "password": "testpassword123"},
+        )
+        headers = {
+            "Authorization": f"Bearer {login_response.get_json()['refresh_token']}"
+        }
+
+        response = client.post("/auth/logout", headers=headers)
+        assert response.status_code == 200
+
+        response = client.post("/auth/refresh", headers=headers)
+        assert response.status_code == 401
+
+    def test_logout_token_without_session(self, client, app, test_user):
+        """Test that an access token issued without a refresh token is revoked."""
+        from flask_jwt_extended import create_access_token
+
+        with app.app_context():
+            token = create_access_token(identity=str(test_user))
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = client.post("/auth/logout", headers=headers)
+        assert response.status_code == 200
+
+        assert client.get("/auth/me", headers=headers).status_code == 401
+        assert client.get("/api/menus", headers=headers).status_code == 401
+
+    def test_revoked_token_expires_from_blocklist(self, app):
+        """Test that revoked tokens are only kept until they expire."""
+        from app.auth import revoke_token
+
+        payload = {"jti": "expiring-jti", "exp": 1_000_060}
+        with (
+            app.app_context(),
+            patch("app.auth.time.time", return_value=1_000_000),
+            patch("app.auth.blocklist.set") as blocklist_set,
+        ):
+            revoke_token(payload)
+
+        blocklist_set.assert_called_once_with(
+            "jwt:revoked:expiring-jti", True, timeout=60
+        )
+
+    def test_revoked_tokens_not_evicted(self, app):
+        """Test that the blocklist keeps revocations past the cache threshold."""
+        from app.auth import check_if_token_revoked, revoke_token
+
+        exp = int(time.time()) + 3600
+        with app.app_context():
+            for i in range(600):
+                revoke_token({"jti": f"jti-{i}", "exp": exp})
+
+            assert check_if_token_revoked({}, {"type": "refresh", "jti": "jti-0"})
+
+
+class TestRefresh:
+    """Tests for refreshing access tokens."""
+
+    def _login(self, client, username, password):
+        """Log in and return the issued tokens."""
+        response = client.post(
+            "/auth/login", json={"username": username, "password": password}
+        )
+        return response.get_json()
+
+    def test_refresh_success(self, client, test_user):
+        """Test getting a new access token with a refresh token."""
+        tokens = self._login(client, "testuser", "testpassword123")
+
+        response = client.post(
+            "/auth/refresh",
+            headers={"Authorization": f"Bearer {tokens['refresh_token']}"},
+        )
+
+        assert response.status_code == 200
+        access_token = response.get_json()["access_token"]
+        response = client.get(
+            "/auth/me", headers={"Authorization": f"Bearer {access_token}"}
+        )
+        assert response.get_json()["username"] == "testuser"
+
+    def test_refresh_with_access_token(self, client, test_user):
+        """Test that access tokens cannot be used to refresh."""
+        tokens = self._login(client, "testuser", "testpassword123")
+
+        response = client.post(
+            "/auth/refresh",
+            headers={"Authorization": f"Bearer {tokens['access_token']}"},
+        )
+
+        assert response.status_code == 422
+
+    def test_refresh_picks_up_role_change(self, client, app, test_user):
+        """Test that refreshed access tokens carry the user's current role."""
+        from app.extensions import db
+        from app.models import User
+
+        tokens = self._login(client, "testuser", "testpassword123")
+
+        with app.app_context():
+            db.session.get(User, test_user).is_manager = True
+            db.session.commit()
+
+        response = client.post(
+            "/auth/refresh",
+            headers={"Authorization": f"Bearer {tokens['refresh_token']}"},
+        )
+        access_token = response.get_json()["access_token"]
+        response = client.get(
+            "/auth/me", headers={"Authorization": f"Bearer {access_token}"}
+        )
+
+        assert response.get_json()["role"] == "manager"
+
+    def test_refresh_after_account_deletion(self, client, test_user):
+        """Test that a deleted account's refresh token is rejected."""
+        tokens = self._login(client, "testuser", "testpassword123")
+        client.delete(
+            "/auth/me",
+            headers={"Authorization": f"Bearer {tokens['access_token']}"},
+            json={"password": "testpassword123"},
+        )
+
+        response = client.post(
+            "/auth/refresh",
+            headers={"Authorization": f"Bearer {tokens['refresh_token']}"},
+        )
+
+        assert response.status_code == 401
+
 
 class TestCurrentUser:
     """Tests for getting current user info."""
@@ -146,10 +289,87 @@ class TestCurrentUser:
 
         assert response.status_code == 200
         data = response.get_json()
+        assert data["id"] == test_user
         assert data["username"] == "testuser"
         assert data["role"] == "user"
         assert "created_at" in data
-        assert "updated_at" in data
+        assert "updated_at" not in data
+
+    def test_get_current_user_from_token_claims(self, client, manager_user):
+        """Test that tokens from login carry the user's name and role."""
+        login_response = client.post(
+            "/auth/login",
+            json={"username": "manager", "password": "managerpassword123"},
+        )
+        token = login_response.get_json()["access_token"]
+
+        with patch("app.auth.db.session.get") as session_get:
+            response = client.get(
+                "/auth/me", headers={"Authorization": f"Bearer {token}"}
+            )
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["id"] == manager_user
+        assert data["username"] == "manager"
+        assert data["role"] == "manager"
+        assert "created_at" in data
+        session_get.assert_not_called()
+
+    def test_token_carries_stored_username(self, client, test_user):
+        """Test that the token names the user as stored, not as typed."""
+        from app.models import User
+
+        stored = User.authenticate
+
+        def case_insensitive(username, password):
+            # What a case-insensitive collation (MySQL/MariaDB) would match
+            return stored(username.lower(), password)
+
+        with patch("app.auth.User.authenticate", side_effect=case_insensitive):
+            login_response = client.post(
+                "/auth/login",
+                json={"username": "TestUser", "password": "testpassword123"},
+            )
+        token = login_response.get_json()["access_token"]
+
+        response = client.get("/auth/me", headers={"Authorization": f"Bearer {token}"})
+
+        assert response.get_json()["username"] == "testuser"
+
+    def test_get_current_user_after_account_deletion(self, client, test_user):
+        """Test that token claims are not served for a deleted account."""
+        login_response = client.post(
+            "/auth/login",
+            json={"username": "testuser", "password": "testpassword123"},
+        )
+        headers = {
+            "Authorization": f"Bearer {login_response.get_json()['access_token']}"
+        }
+        response = client.delete(
+            "/auth/me", headers=headers, json={"password": "testpassword123"}
+        )
+        assert response.status_code == 200
+
+        response = client.get("/auth/me", headers=headers)
+
+        assert response.status_code == 401
+
+    def test_get_current_user_deleted_without_claims(
+        self, client, app, auth_headers, test_user
+    ):
+        """Test that tokens without claims get 404 once the user is gone."""
+        from app.extensions import db
+        from app.models import User
+
+        with app.app_context():
+            # Deleted by an admin, so the session was not revoked
+            db.session.delete(db.session.get(User, test_user))
+            db.session.commit()
+
+        response = client.get("/auth/me", headers=auth_headers)
+
+        assert response.status_code == 404
 
     def test_get_current_user_admin(self, client, admin_auth_headers, admin_user):
         """Test getting current admin user info."""
@@ -165,3 +385,82 @@ class TestCurrentUser:
         response = client.get("/auth/me")
 
         assert response.status_code == 401
+
+
+class TestTokenDecoding:
+    """Tests for cached token verification."""
+
+    def test_token_verified_once(self, client, test_user):
+        """Test that repeated requests reuse the verified claims."""
+        login_response = client.post(
+            "/auth/login",
+            json={"username": "testuser", "password": "testpassword123"},
+        )
+        headers = {
+            "Authorization": f"Bearer {login_response.get_json()['access_token']}"
+        }
+
+        assert client.get("/auth/me", headers=headers).status_code == 200
+
+        with patch("flask_jwt_extended.jwt_manager._decode_jwt") as decode:
+            response = client.get("/auth/me", headers=headers)
+
+        assert response.status_code == 200
+        decode.assert_not_called()
+
+    def test_expired_token_rejected(self, client, app, test_user):
+        """Test that cached claims are not used once the token expires."""
+        from datetime import timedelta
+
+        import jwt
+        from flask_jwt_extended import create_access_token
+        from flask_jwt_extended.jwt_manager import _decode_jwt
+
+        with app.app_context():
+            token = create_access_token(
+                identity=str(test_user), expires_delta=timedelta(seconds=60)
+            )
+        headers = {"Authorization": f"Bearer {token}"}
+        assert client.get("/auth/me", headers=headers).status_code == 200
+
+        def decode_after_expiry(**kwargs):
+            if not kwargs["allow_expired"]:
+                raise jwt.ExpiredSignatureError("Signature has expired")
+            return _decode_jwt(**kwargs)
+
+        with (
+            patch("app.extensions.time.time", return_value=time.time() + 120),
+            patch(
+                "flask_jwt_extended.jwt_manager._decode_jwt",
+                side_effect=decode_after_expiry,
+            ),
+        ):
+            response = client.get("/auth/me", headers=headers)
+
+        assert response.status_code == 401
+
+    def test_cached_claims_not_reused_after_audience_change(
+        self, client, app, auth_headers
+    ):
+        """Test that the decode settings are part of the cache key."""
+        assert client.get("/auth/me", headers=auth_headers).status_code == 200
+
+        with patch.dict(app.config, {"JWT_DECODE_AUDIENCE": "another-service"}):
+            response = client.get("/auth/me", headers=auth_headers)
+
+        assert response.status_code == 422
+        assert response.get_json()["msg"] == 'Token is missing the "aud" claim'
+
+    def test_custom_decode_key_loader_bypasses_cache(self, client, auth_headers):
+        """Test that a custom decode key loader is called for every request."""
+        from app.extensions import jwt
+
+        assert client.get("/auth/me", headers=auth_headers).status_code == 200
+
+        with patch.object(
+            jwt, "_decode_key_callback", lambda header, payload: "a-different-key"
+        ):
+            response = client.get("/auth/me", headers=auth_headers)
+
+        assert response.status_code == 422
+        assert response.get_json()["msg"] == "Signature verification failed"
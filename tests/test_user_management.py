@@ -1,5 +1,12 @@
 """Tests for user management endpoints (email update, password update, account deletion)."""
 
+import pytest
+from flask_jwt_extended import decode_token
+
+from app.auth import check_if_token_revoked, update_email, update_password
+from app.extensions import db
+from app.models import Dish, Menu, User
+
 
 class TestUpdateEmail:
     """Tests for updating user email."""
@@ -16,21 +23,29 @@ class TestUpdateEmail:
         data = response.get_json()
         assert data["message"] == "Email updated successfully"
 
-    def test_update_email_invalid_format(self, client, auth_headers):
-        """Test email update with invalid format."""
-        response = client.patch(
-            "/auth/me/email",
-            headers=auth_headers,
-            json={"email": "not-an-email"},
-        )
+    @pytest.mark.parametrize(
+        ("body", "error"),
+        [
+            ({"email": "not-an-email"}, "Invalid email format"),
+            ({}, "Email is required"),
+        ],
+        ids=["invalid_format", "missing_email"],
+    )
+    def test_update_email_invalid(self, app, auth_headers, body, error):
+        """Test email update with invalid input.
+
+        The view is called directly: only its validation is under test.
+        """
+        with app.test_request_context(
+            "/auth/me/email", method="PATCH", headers=auth_headers, json=body
+        ):
+            response = app.make_response(update_email())
 
         assert response.status_code == 400
-        assert "Invalid email format" in response.get_json()["error"]
+        assert error in response.get_json()["error"]
 
     def test_update_email_already_exists(self, client, auth_headers, app):
         """Test email update with email that already exists."""
-        from app.models import User
-
         # Create another user with an email
         with app.app_context():
             User.create(
@@ -48,17 +63,6 @@ class TestUpdateEmail:
         assert response.status_code == 409
         assert "Email already in use" in response.get_json()["error"]
 
-    def test_update_email_missing_data(self, client, auth_headers):
-        """Test email update with missing email."""
-        response = client.patch(
-            "/auth/me/email",
-            headers=auth_headers,
-            json={},
-        )
-
-        assert response.status_code == 400
-        assert "Email is required" in response.get_json()["error"]
-
     def test_update_email_no_data(self, client, auth_headers):
         """Test email update with no data."""
         response = client.patch("/auth/me/email", headers=auth_headers, json=None)
@@ -77,9 +81,6 @@ class TestUpdateEmail:
 
     def test_update_email_same_as_current(self, client, auth_headers, app, test_user):
         """Test updating email to the same value as current user's email."""
-        from app.extensions import db
-        from app.models import User
-
         # First, set an email for the test user
         with app.app_context():
             user = db.session.get(User, test_user)
@@ -94,6 +95,21 @@ class TestUpdateEmail:
 
         assert response.status_code == 200
 
+    def test_update_email_deleted_user(self, client, auth_headers, app, test_user):
+        """Test email update with a token for a user that no longer exists."""
+        with app.app_context():
+            db.session.delete(db.session.get(User, test_user))
+            db.session.commit()
+
+        response = client.patch(
+            "/auth/me/email",
+            headers=auth_headers,
+            json={"email": "new@example.com"},
+        )
+
+        assert response.status_code == 404
+        assert "User not found" in response.get_json()["error"]
+
 
 class TestUpdatePassword:
     """Tests for updating user password."""
@@ -120,75 +136,82 @@ class TestUpdatePassword:
         )
         assert login_response.status_code == 200
 
-    def test_update_password_wrong_current(self, client, auth_headers):
-        """Test password update with wrong current password."""
-        response = client.patch(
-            "/auth/me/password",
-            headers=auth_headers,
-            json={
-                "current_password": "wrongpassword",
-                "new_password": "newpassword456",
-            },
+    @pytest.mark.usefixtures("user_lookup_cache")
+    def test_update_password_after_cached_login(self, client, auth_headers, test_user):
+        """Test that a login cached before the change uses the new password."""
+        client.post(
+            "/auth/login",
+            json={"username": "testuser", "password": "testpassword123"},
         )
 
-        assert response.status_code == 401
-        assert "Current password is incorrect" in response.get_json()["error"]
-
-    def test_update_password_weak_password(self, client, auth_headers):
-        """Test password update with weak password."""
-        response = client.patch(
+        client.patch(
             "/auth/me/password",
             headers=auth_headers,
             json={
                 "current_password": "testpassword123",
-                "new_password": "weak",
+                "new_password": "newpassword456",
             },
         )
 
-        assert response.status_code == 400
-        assert "at least 8 characters" in response.get_json()["error"]
-
-    def test_update_password_no_digits(self, client, auth_headers):
-        """Test password update with password missing digits."""
-        response = client.patch(
-            "/auth/me/password",
-            headers=auth_headers,
-            json={
-                "current_password": "testpassword123",
-                "new_password": "nodigitshere",
-            },
+        old_login = client.post(
+            "/auth/login",
+            json={"username": "testuser", "password": "testpassword123"},
         )
+        new_login = client.post(
+            "/auth/login",
+            json={"username": "testuser", "password": "newpassword456"},
+        )
+        assert old_login.status_code == 401
+        assert new_login.status_code == 200
 
-        assert response.status_code == 400
-        assert "at least one digit" in response.get_json()["error"]
-
-    def test_update_password_no_letters(self, client, auth_headers):
-        """Test password update with password missing letters."""
+    def test_update_password_wrong_current(self, client, auth_headers):
+        """Test password update with wrong current password."""
         response = client.patch(
             "/auth/me/password",
             headers=auth_headers,
             json={
-                "current_password": "testpassword123",
-                "new_password": "12345678",
+                "current_password": "wrongpassword",
+                "new_password": "newpassword456",
             },
         )
 
-        assert response.status_code == 400
-        assert "at least one letter" in response.get_json()["error"]
+        assert response.status_code == 401
+        assert "Current password is incorrect" in response.get_json()["error"]
 
-    def test_update_password_missing_fields(self, client, auth_headers):
-        """Test password update with missing fields."""
-        response = client.patch(
-            "/auth/me/password",
-            headers=auth_headers,
-            json={"current_password": "testpassword123"},
-        )
+    @pytest.mark.parametrize(
+        ("body", "error"),
+        [
+            (
+                {"current_password": "testpassword123", "new_password": "weak"},
+                "at least 8 characters",
+            ),
+            (
+                {"current_password": "testpassword123", "new_password": "nodigitshere"},
+                "at least one digit",
+            ),
+            (
+                {"current_password": "testpassword123", "new_password": "12345678"},
+                "at least one letter",
+            ),
+            (
+                {"current_password": "testpassword123"},
+                "Current password and new password are required",
+            ),
+        ],
+        ids=["weak_password", "no_digits", "no_letters", "missing_fields"],
+    )
+    def test_update_password_invalid(self, app, auth_headers, body, error):
+        """Test password update with invalid input.
+
+        The view is called directly: only its validation is under test.
+        """
+        with app.test_request_context(
+            "/auth/me/password", method="PATCH", headers=auth_headers, json=body
+        ):
+            response = app.make_response(update_password())
 
         assert response.status_code == 400
-        assert (
-            "Current password and new password are required"
-            in response.get_json()["error"]
-        )
+        assert error in response.get_json()["error"]
 
     def test_update_password_no_data(self, client, auth_headers):
         """Test password update with no data."""
@@ -215,9 +238,6 @@ class TestDeleteAccount:
 
     def test_delete_account_success(self, client, auth_headers, test_user, app):
         """Test successful account deletion."""
-        from app.extensions import db
-        from app.models import User
-
         response = client.delete(
             "/auth/me",
             headers=auth_headers,
@@ -237,9 +257,6 @@ class TestDeleteAccount:
         self, client, auth_headers, test_user, test_menu, test_dish, app
     ):
         """Test account deletion cascades to menus and dishes."""
-        from app.extensions import db
-        from app.models import Dish, Menu, User
-
         response = client.delete(
             "/auth/me",
             headers=auth_headers,
@@ -248,15 +265,17 @@ class TestDeleteAccount:
 
         assert response.status_code == 200
 
-        # Verify user, menu, and dish are all deleted
+        # Verify user, menu, and dish are all deleted, in a single query
         with app.app_context():
-            user = db.session.get(User, test_user)
-            menu = db.session.get(Menu, test_menu)
-            dish = db.session.get(Dish, test_dish)
+            remaining = db.session.execute(
+                db.select(
+                    db.select(User.id).where(User.id == test_user).exists(),
+                    db.select(Menu.id).where(Menu.id == test_menu).exists(),
+                    db.select(Dish.id).where(Dish.id == test_dish).exists(),
+                )
+            ).one()
 
-            assert user is None
-            assert menu is None
-            assert dish is None
+            assert tuple(remaining) == (False, False, False)
 
     def test_delete_account_wrong_password(self, client, auth_headers):
         """Test account deletion with wrong password."""
@@ -296,15 +315,44 @@ class TestDeleteAccount:
 
         assert response.status_code == 401
 
-    def test_delete_account_token_revoked(self, client, auth_headers, test_user):
-        """Test that token is revoked after account deletion."""
+    def test_delete_account_token_revoked(self, client, test_user, app):
+        """Test that the session is revoked after account deletion."""
+        login_response = client.post(
+            "/auth/login",
+            json={"username": "testuser", "password": "testpassword123"},
+        )
+        tokens = login_response.get_json()
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+
         # Delete account
+        client.delete("/auth/me", headers=headers, json={"password": "testpassword123"})
+
+        # Check the blocklist directly
+        with app.app_context():
+            refresh_claims = decode_token(tokens["refresh_token"])
+            assert check_if_token_revoked({}, refresh_claims)
+
+    def test_deleted_user_id_not_reused(self, client, auth_headers, test_user):
+        """Test that a new account never gets the id of a deleted one."""
         client.delete(
-            "/auth/me",
-            headers=auth_headers,
-            json={"password": "testpassword123"},
+            "/auth/me", headers=auth_headers, json={"password": "testpassword123"}
         )
 
-        # Try to use token again
-        response = client.get("/auth/me", headers=auth_headers)
-        assert response.status_code == 401
+        response = client.post(
+            "/auth/register",
+            json={"username": "newcomer", "password": "password123"},
+        )
+
+        assert response.get_json()["user_id"] != test_user
+
+        # The deleted user's token does not act as the new account
+        client.post("/api/menus", headers=auth_headers, json={"title": "Not mine"})
+        login_response = client.post(
+            "/auth/login",
+            json={"username": "newcomer", "password": "password123"},
+        )
+        token = login_response.get_json()["access_token"]
+        response = client.get(
+            "/api/menus", headers={"Authorization": f"Bearer {token}"}
+        )
+        assert response.get_json() == []
@@ -0,0 +1,223 @@
+"""Tests for User model helpers."""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.extensions import cache, db
+from app.models import User
+
+
+@pytest.mark.usefixtures("user_lookup_cache")
+class TestUserLookupCache:
+    """Tests for cached user lookups."""
+
+    def test_get_by_username_is_cached(self, app, test_user):
+        """Test that a cached lookup returns the user without querying the DB."""
+        with app.app_context():
+            User.get_by_username("testuser")
+            db.session.remove()
+
+            assert cache.get("user:username:testuser") is not None
+
+            user = User.get_by_username("testuser")
+            assert user.id == test_user
+            assert user.check_password("testpassword123")
+            assert user in db.session
+
+    def test_unknown_username_cached_until_user_created(self, app):
+        """Test that cached misses are dropped once the user exists."""
+        with app.app_context():
+            assert User.get_by_username("newcomer") is None
+            assert cache.get("user:username:newcomer") is False
+
+            User.create(username="newcomer", password="password123")
+
+            assert cache.get("user:username:newcomer") is None
+            assert User.get_by_username("newcomer") is not None
+
+    def test_cache_invalidated_on_update(self, app, test_user):
+        """Test that changing a user drops the cached lookups."""
+        with app.app_context():
+            user = User.get_by_username("testuser")
+            User.get_by_email("old@example.com")
+
+            user.email = "old@example.com"
+            db.session.commit()
+            assert cache.get("user:email:old@example.com") is None
+
+            User.get_by_email("old@example.com")
+            user.email = "new@example.com"
+            user.set_password("newpassword456")
+            db.session.commit()
+
+            assert cache.get("user:username:testuser") is None
+            assert cache.get("user:email:old@example.com") is None
+            db.session.remove()
+
+            assert User.get_by_username("testuser").check_password("newpassword456")
+            assert User.get_by_email("old@example.com") is None
+
+    def test_get_auth_tuple(self, app, admin_user):
+        """Test that the auth lookup returns only authentication columns."""
+        with app.app_context():
+            auth = User.get_auth_tuple("admin")
+
+            assert auth.id == admin_user
+            assert auth.username == "admin"
+            assert auth.is_admin is True
+            assert auth.is_manager is False
+            assert auth.check_password("adminpassword123")
+            assert not auth.check_password("wrongpassword")
+            assert User.get_auth_tuple("nobody") is None
+
+    def test_auth_tuple_invalidated_on_role_change(self, app, test_user):
+        """Test that role changes are visible to the cached auth lookup."""
+        with app.app_context():
+            assert User.get_auth_tuple("testuser").is_manager is False
+
+            user = db.session.get(User, test_user)
+            user.is_manager = True
+            db.session.commit()
+
+            assert User.get_auth_tuple("testuser").is_manager is True
+
+    def test_cache_invalidated_after_commit(self, app, test_user):
+        """Test that cached lookups are only dropped once the change commits."""
+        with app.app_context():
+            User.get_auth_tuple("testuser")
+
+            user = db.session.get(User, test_user)
+            user.is_manager = True
+            db.session.flush()
+            assert cache.get("user:auth:testuser") is not None
+
+            db.session.commit()
+            assert cache.get("user:auth:testuser") is None
+
+    def test_rolled_back_change_keeps_cache(self, app, test_user):
+        """Test that a rolled back change doesn't drop cached lookups later."""
+        with app.app_context():
+            user = db.session.get(User, test_user)
+            user.is_manager = True
+            db.session.flush()
+            db.session.rollback()
+
+            User.get_auth_tuple("testuser")
+            db.session.commit()
+
+            assert cache.get("user:auth:testuser") is not None
+
+
+class TestUserLookupWithoutCache:
+    """Tests for user lookups with the cache disabled (the default)."""
+
+    def test_lookups_not_cached_by_default(self, app, test_user):
+        """Test that lookups go to the database when the cache is off."""
+        with app.app_context():
+            assert User.get_by_username("testuser").id == test_user
+            assert User.get_auth_tuple("testuser").id == test_user
+            assert User.get_by_email("nobody@example.com") is None
+
+            assert cache.get("user:username:testuser") is None
+            assert cache.get("user:auth:testuser") is None
+            assert cache.get("user:email:nobody@example.com") is None
+
+    def test_user_changes_skip_cache_when_disabled(self, app, test_user):
+        """Test that user writes don't touch the cache when it is off."""
+        with app.app_context(), patch("app.models.user.cache.delete") as delete:
+            db.session.get(User, test_user).email = "new@example.com"
+            db.session.commit()
+
+        delete.assert_not_called()
+
+
+class TestPasswordHashing:
+    """Tests for password hashing."""
+
+    def test_set_password_uses_configured_method(self, app):
+        """Test that passwords are hashed with PASSWORD_HASH_METHOD."""
+        with (
+            app.app_context(),
+            patch.dict(app.config, {"PASSWORD_HASH_METHOD": "pbkdf2:sha256:1000"}),
+        ):
+            user = User(username="hashuser")
+            user.set_password("password123")
+
+            assert user.password_hash.startswith("pbkdf2:sha256:1000$")
+            assert user.check_password("password123")
+
+    def test_default_method_is_scrypt(self, app):
+        """Test that the default hashing method is scrypt."""
+        from app.config import Config
+
+        with (
+            app.app_context(),
+            patch.dict(
+                app.config, {"PASSWORD_HASH_METHOD": Config.PASSWORD_HASH_METHOD}
+            ),
+        ):
+            user = User(username="hashuser")
+            user.set_password("password123")
+
+            assert user.password_hash.startswith("scrypt:32768:8:1$")
+            assert user.check_password("password123")
+
+
+class TestAuthenticate:
+    """Tests for credential verification."""
+
+    def test_authenticate_valid_credentials(self, app, test_user):
+        """Test that valid credentials return the user's auth row."""
+        with app.app_context():
+            auth = User.authenticate("testuser", "testpassword123")
+            assert auth.id == test_user
+
+    def test_authenticate_wrong_password(self, app, test_user):
+        """Test that a wrong password is rejected."""
+        with app.app_context():
+            assert User.authenticate("testuser", "wrongpassword") is None
+
+    def test_authenticate_unknown_user_still_hashes(self, app):
+        """Test that unknown usernames pay for a password check too."""
+        with (
+            app.app_context(),
+            patch(
+                "app.models.user.check_password_hash", return_value=True
+            ) as check_hash,
+        ):
+            assert User.authenticate("nobody", "anypassword") is None
+            check_hash.assert_called_once()
+
+    def test_dummy_hash_computed_at_startup(self, app):
+        """Test that the first unknown-username login doesn't hash twice."""
+        from app import create_app
+        from app.config import TestingConfig
+        from app.models.user import dummy_password_hash
+
+        dummy_password_hash.cache_clear()
+        create_app(TestingConfig)
+
+        with (
+            app.app_context(),
+            patch("app.models.user.generate_password_hash") as generate,
+        ):
+            assert User.authenticate("nobody", "anypassword") is None
+
+        generate.assert_not_called()
+
+
+class TestPasswordStrength:
+    """Tests for password strength validation."""
+
+    def test_valid_password(self):
+        """Test that passwords with letters and digits are accepted."""
+        assert User.validate_password_strength("abc12345") == (True, "")
+        assert User.validate_password_strength("1" * 50 + "a") == (True, "")
+
+    def test_invalid_passwords(self):
+        """Test the error reported for each kind of weak password."""
+        assert "at least 8 characters" in User.validate_password_strength("a1")[1]
+        assert "at least one digit" in User.validate_password_strength("abcdefgh")[1]
+        assert "at least one letter" in User.validate_password_strength("12345678")[1]
+        assert "at least one digit" in User.validate_password_strength("!!!!!!!!")[1]
@@ -10,6 +10,7 @@ Production (PythonAnywhere):
     from flask_app import app as application
 """
 
+import functools
 import os
 
 from app import create_app
@@ -20,8 +21,19 @@ config_class = (
     ProductionConfig if os.getenv("FLASK_ENV") == "production" else DevelopmentConfig
 )
 
-# Create app instance
-app = create_app(config_class)
+
+@functools.cache
+def get_app():
+    """Create the app instance on first use."""
+    return create_app(config_class)
+
+
+def __getattr__(name):
+    # Build ``app`` lazily so importing this module does not create it
+    if name == "app":
+        return get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == "__main__":
-    app.run()
+    get_app().run()